@@ -1,56 +1,134 @@
 import logging
+from functools import partial
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 
 import happi
-import simplejson
 from happi.backends import JSONBackend
 
-import pcdsdevices
-from pcdsdevices import sim, OffsetMirror
-from pcdsdevices.happireader import construct_device
-from pswalker.examples import patch_pims
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
 
 logger = logging.getLogger(__name__)
 
+
+def read_json(path):
+    """
+    Load a JSON file, using orjson when it is available
+
+    Parameters
+    ----------
+    path : str
+        Path to the JSON file
+
+    Returns
+    -------
+    data : dict or list
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def write_json(path, data):
+    """
+    Write data to a JSON file, using orjson when it is available
+
+    Parameters
+    ----------
+    path : str
+        Path to the JSON file
+
+    data : dict or list
+        Information to serialize
+    """
+    if orjson is not None:
+        raw = orjson.dumps(data, option=(orjson.OPT_INDENT_2 |
+                                         orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        raw = json.dumps(data, indent=2).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(raw)
+
 #####################
 # Simulated Devices #
 #####################
-#Source
-s   = sim.source.Undulator('test_undulator', name='test_undulator')
-
-#Mirrors
-m1  = sim.mirror.OffsetMirror('test_m1h', 'test_m1h_xy', name='test_m1h',
-                              z=90.510, alpha=0.0014)
-m2  = sim.mirror.OffsetMirror('test_m2h', 'test_m2h_xy', name='test_m2h',
-                              x=0.0317324, z=101.843, alpha=0.0014)
-xrtm2 = sim.mirror.OffsetMirror('test_xrtm2', 'test_xrtm2_xy',
-                                name='test_xrtm2',
-                                x=0.0317324, z=200, alpha=0.0014)
-#Imagers
-y1     = sim.pim.PIM('test_p3h', x=0.0317324, z=103.660, name='test_p3h',
-                     zero_outside_yag=True)
-y2     = sim.pim.PIM('test_dg3', x=0.0317324, z=375.000, name='test_dg3',
-                     zero_outside_yag=True)
-mecy1  = sim.pim.PIM('test_mecy1', x=0.0317324, z=350, name='test_mect1',
-                     zero_outside_yag=True)
-mfxdg1 = mecy1
-
-#Create simulation with proper distances
-patch_pims([y1, y2], mirrors=[m1, m2], source=s)
-patch_pims([mecy1], mirrors=[xrtm2], source=s)
-
-#Pseudo-config
-sim_config = {'sim_m1h' : {'mirror'   : m1,
-                           'imager'   : y1,
-                           'rotation' : 0,
-                           'slits'    : None},
-              'sim_m2h' : {'mirror'   : m2,
-                           'imager'   : y2,
-                           'rotation' : 0,
-                           'slits'    : None},
-              'sim_mfx' : {'mirror'   : xrtm2,
-                           'imager'   : mfxdg1,
-                           'rotation' : 0,
-                           'slits'    : None}}
+def _build_sim_config():
+    """
+    Create the simulated devices and the pseudo-config that groups them
+    """
+    from pcdsdevices import sim
+    from pswalker.examples import patch_pims
+    #Source
+    s   = sim.source.Undulator('test_undulator', name='test_undulator')
+
+    #Mirrors
+    m1  = sim.mirror.OffsetMirror('test_m1h', 'test_m1h_xy', name='test_m1h',
+                                  z=90.510, alpha=0.0014)
+    m2  = sim.mirror.OffsetMirror('test_m2h', 'test_m2h_xy', name='test_m2h',
+                                  x=0.0317324, z=101.843, alpha=0.0014)
+    xrtm2 = sim.mirror.OffsetMirror('test_xrtm2', 'test_xrtm2_xy',
+                                    name='test_xrtm2',
+                                    x=0.0317324, z=200, alpha=0.0014)
+    #Imagers
+    y1     = sim.pim.PIM('test_p3h', x=0.0317324, z=103.660, name='test_p3h',
+                         zero_outside_yag=True)
+    y2     = sim.pim.PIM('test_dg3', x=0.0317324, z=375.000, name='test_dg3',
+                         zero_outside_yag=True)
+    mecy1  = sim.pim.PIM('test_mecy1', x=0.0317324, z=350, name='test_mect1',
+                         zero_outside_yag=True)
+    mfxdg1 = mecy1
+
+    #Create simulation with proper distances
+    patch_pims([y1, y2], mirrors=[m1, m2], source=s)
+    patch_pims([mecy1], mirrors=[xrtm2], source=s)
+
+    #Pseudo-config
+    return {'sim_m1h' : {'mirror'   : m1,
+                         'imager'   : y1,
+                         'rotation' : 0,
+                         'slits'    : None},
+            'sim_m2h' : {'mirror'   : m2,
+                         'imager'   : y2,
+                         'rotation' : 0,
+                         'slits'    : None},
+            'sim_mfx' : {'mirror'   : xrtm2,
+                         'imager'   : mfxdg1,
+                         'rotation' : 0,
+                         'slits'    : None}}
+
+
+class _LazySimConfig(Mapping):
+    """
+    Read-only mapping that only creates the simulated devices the first time
+    one of its entries is requested
+    """
+    def __init__(self, factory):
+        self._factory = factory
+        self._config = None
+
+    @property
+    def config(self):
+        if self._config is None:
+            self._config = self._factory()
+        return self._config
+
+    def __getitem__(self, key):
+        return self.config[key]
+
+    def __iter__(self):
+        return iter(self.config)
+
+    def __len__(self):
+        return len(self.config)
+
+
+sim_config = _LazySimConfig(_build_sim_config)
 
 sim_alignments = {'HOMS': [['sim_m1h', 'sim_m2h']],
                   'MFX': [['sim_mfx']]}
@@ -84,15 +162,58 @@ class ConfigReader:
         Path to JSON file that holds device names to load from happi
     """
     device_types = ['mirror', 'imager', 'slits']
+    max_workers  = 16
     info_swap    = {'mirror' : {'states' : 'prefix_xy'},
                     'imager' : {'data'   : 'prefix_det'}}
     def __init__(self, happi_json, system_json):
-        #Load happi client
-        self.client  = happi.Client(database=JSONBackend(happi_json))
-        #Load system information
-        self.live_systems = simplejson.load(open(system_json, 'r'))
+        #Happi client is created on first request
+        self._happi_json = happi_json
+        self._client = None
+        #System information is loaded on first request
+        self._system_json = system_json
+        self._live_systems = None
         #Create cache of previously loaded devices
         self.cache = {}
+        #Index of happi containers by name, built on first lookup
+        self._happi_cache = None
+        #Create cache of resolved pcdsdevices classes
+        self._cls_cache = {}
+
+    @property
+    def client(self):
+        """
+        The happi client, created on first use
+
+        Accessing this for the first time loads the happi database, so callers
+        that want to pay this cost up front can simply touch the attribute
+        """
+        if self._client is None and self._happi_json is not None:
+            self._client = happi.Client(database=JSONBackend(self._happi_json))
+        return self._client
+
+    @client.setter
+    def client(self, client):
+        self._client = client
+        #Containers from the old client are no longer valid
+        self._happi_cache = None
+
+    @property
+    def live_systems(self):
+        """
+        Mapping of system names to device names, read from disk on first use
+        """
+        if self._live_systems is None:
+            self._live_systems = read_json(self._system_json)
+        return self._live_systems
+
+    @live_systems.setter
+    def live_systems(self, systems):
+        self._live_systems = systems
+        #Rebuild the device name index from the new systems on next use
+        try:
+            del self.systems_with_dict
+        except AttributeError:
+            pass
 
     @property
     def available_systems(self):
@@ -124,7 +245,7 @@ class ConfigReader:
             for system, components in self.live_systems.items():
                 for name in components.values():
                     if isinstance(name, str):
-                        d[name] = d.get(name, []) + [system]
+                        d.setdefault(name, []).append(system)
             self.systems_with_dict = d
             return self.get_systems_with(key)
 
@@ -153,7 +274,7 @@ class ConfigReader:
             logger.debug("Using cached devices for %s", system)
             return self.cache[system]
 
-        if system not in self.available_systems:
+        if system not in self.live_systems:
             logger.error("No system information found for %s", system)
 
         #Create new system
@@ -211,22 +332,27 @@ class ConfigReader:
         `pcdsdevices.Device` or `None`
 
         """
+        return self._connect_device(self._build_device(name), timeout=timeout)
+
+    def _build_device(self, name):
+        """
+        Instantiate a device from its happi container without waiting for its
+        signals to connect, returning `None` if this fails
+        """
+        #Deferred so that importing skywalker does not pull in ophyd devices
+        from pcdsdevices.happireader import construct_device
         try:
             #Get device information
             logger.debug("Loading %s ...", name)
-            happi_obj = self.client.load_device(name=name)
+            happi_obj = self._load_happi_obj(name)
             #Grab proper device class
-            device_cls = getattr(pcdsdevices,
-                                 happi_obj.extraneous['device_class'])
-            #Extra arguments and keywords
-            (_args, _kwargs) = (happi_obj.extraneous.get(key)
-                                for key in ('args', 'kwargs'))
+            cls_name = happi_obj.extraneous['device_class']
+            device_cls = self._device_class(cls_name)
+            #Extra keywords
+            _kwargs = happi_obj.extraneous.get('kwargs') or {}
             dev = construct_device(happi_obj,
                                    device_class=device_cls,
                                    **_kwargs)
-            #Instantiate all our signals, even if lazy
-            dev.wait_for_connection(all_signals=True,
-                                    timeout=timeout)
         #Happi failure
         except happi.errors.SearchError:
             logger.error("Unable to find device %s in the database",
@@ -244,13 +370,70 @@ class ConfigReader:
         #Do not return anything if we saw an exception
         return None
 
+    def _connect_device(self, dev, timeout=1):
+        """
+        Wait for every signal of a device to connect, returning `None` if
+        this fails or if no device is given
+        """
+        if dev is None:
+            return None
+        try:
+            #Instantiate all our signals, even if lazy
+            dev.wait_for_connection(all_signals=True,
+                                    timeout=timeout)
+        except Exception:
+            logger.exception('Error loading device %s', dev.name)
+            return None
+        return dev
+
+    def _load_happi_obj(self, name):
+        """
+        Load a happi container by name
+
+        The first call indexes every container in the database by name in a
+        single pass, so later lookups do not search the database again.
+
+        Parameters
+        ----------
+        name : str
+            Name of the device
+
+        Returns
+        -------
+        container : `happi.Device`
+        """
+        if self._happi_cache is None:
+            self._happi_cache = {container.name: container
+                                 for container in self.client.all_devices}
+        try:
+            return self._happi_cache[name]
+        except KeyError:
+            #Let happi search and report the missing device
+            happi_obj = self.client.load_device(name=name)
+            self._happi_cache[name] = happi_obj
+            return happi_obj
+
+    def _device_class(self, cls_name):
+        """
+        Find a class in pcdsdevices by name, caching the result
+        """
+        try:
+            return self._cls_cache[cls_name]
+        except KeyError:
+            import pcdsdevices
+            device_cls = getattr(pcdsdevices, cls_name)
+            self._cls_cache[cls_name] = device_cls
+            return device_cls
+
     def load_configuration(self, timeout=1):
         """
         Load the entire configuration
 
         In order to still represent devices in the lightpath that fail to load,
         if a device fails on intialization the happi container is returned
-        instead.
+        instead. Devices are created one at a time, then wait for their EPICS
+        connections in a pool of threads so that the timeouts overlap rather
+        than add up.
 
         Parameters
         ----------
@@ -269,16 +452,25 @@ class ConfigReader:
         devices = list()
         containers = list()
         logger.info("Loading LCLS Lightpath devices ...")
-        #Iterate through all the devices
+        #Gather all the active devices
+        active = list()
         for container in self.client.all_devices:
-            #Create a device
             if not container.active:
                 logger.debug("Ignore inactive device %s", container.name)
                 continue
-
-            dev = self.load_device(container.name,
-                                   timeout=timeout)
-            #Add to our list
+            active.append(container)
+        if not active:
+            return devices, containers
+        #Create the devices on this thread, device construction is not
+        #known to be thread-safe
+        built = [self._build_device(c.name) for c in active]
+        #Only the connection waits, spent blocked on EPICS, run in parallel
+        connect = partial(self._connect_device, timeout=timeout)
+        workers = min(self.max_workers, len(active))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            loaded = list(executor.map(connect, built))
+        #Add to our list
+        for container, dev in zip(active, loaded):
             if dev is not None:
                 devices.append(dev)
             else:
@@ -289,6 +481,7 @@ class ConfigReader:
 
 class SimConfigReader(ConfigReader):
     def __init__(self):
+        self._happi_json = None
         self.client = None
         self.live_systems = {}
         self._devs = {}
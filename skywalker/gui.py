@@ -1,30 +1,21 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import queue
 import logging
+from logging.handlers import QueueListener
 from os import path
 from functools import partial
-from threading import RLock
-
-import simplejson as json
-
-from bluesky import RunEngine
-from bluesky.utils import install_qt_kicker
-from bluesky.preprocessors import run_wrapper, stage_wrapper
+from threading import Lock
 
 from pydm import Display
 from pydm.PyQt.QtCore import (pyqtSlot, pyqtSignal,
                               QCoreApplication,
-                              QObject, QEvent)
+                              QObject, QEvent, QTimer)
 from pydm.PyQt.QtGui import QDoubleValidator, QDialog
 
-from pcdsdevices.epics.attenuator import FeeAtt
-from pswalker.plan_stubs import slit_scan_fiducialize
-from pswalker.suspenders import (BeamEnergySuspendFloor,
-                                 BeamRateSuspendFloor)
-from pswalker.skywalker import skywalker
-
-from skywalker.config import ConfigReader, SimConfigReader, sim_alignments
-from skywalker.logger import GuiHandler
+from skywalker.config import (ConfigReader, SimConfigReader, sim_alignments,
+                              read_json, write_json)
+from skywalker.logger import CopyQueueHandler, GuiHandler
 from skywalker.utils import ad_stats_x_axis_rot
 from skywalker.settings import Setting, SettingsGroup
 from skywalker.widgetgroup import (ObjWidgetGroup, ValueWidgetGroup,
@@ -32,6 +23,23 @@ from skywalker.widgetgroup import (ObjWidgetGroup, ValueWidgetGroup,
 
 logger = logging.getLogger(__name__)
 MAX_MIRRORS = 2
+NONE_PAD = (None,) * MAX_MIRRORS
+CONFIG_FLUSH_MS = 250
+# (header, name, default, required) for every entry in the settings window
+SETTINGS_DEFAULTS = (('alignment', 'first_step', 6.0, True),
+                     ('alignment', 'tolerance', 5.0, True),
+                     ('alignment', 'averages', 100, True),
+                     ('alignment', 'timeout', 600.0, True),
+                     ('alignment', 'tol_scaling', 8.0, True),
+                     ('suspenders', 'min_beam', 1.0, False),
+                     ('suspenders', 'min_rate', 1.0, False),
+                     ('slits', 'slit_width', 0.2, True),
+                     ('slits', 'samples', 100, True),
+                     ('setup', 'close_fee_att', True, True))
+SETTINGS_COLUMNS = [['alignment'], ['slits', 'suspenders', 'setup']]
+STATUS_TEXT = {state: ' Status: ' + state.capitalize()
+               for state in ('idle', 'running', 'paused', 'aborting',
+                             'halting', 'stopping', 'panicked')}
 
 
 class SkywalkerGui(Display):
@@ -68,14 +76,7 @@ class SkywalkerGui(Display):
                 self.setStyleSheet(qdarkstyle.load_stylesheet_pyqt5())
 
         # Configure debug file after all the qt logs
-        logging.basicConfig(level=logging.DEBUG,
-                            format=('%(asctime)s '
-                                    '%(name)-12s '
-                                    '%(levelname)-8s '
-                                    '%(message)s'),
-                            datefmt='%m-%d %H:%M:%S',
-                            filename='./skywalker_debug.log',
-                            filemode='a')
+        self._log_listener = self.setup_file_logger()
 
         # Set self.sim, self.loader, self.nominal_config
         self.sim = not live
@@ -86,16 +87,23 @@ class SkywalkerGui(Display):
         self.config_cache = {}
         self.cache_config()
 
+        # Collect saves that happen close together into one disk write
+        self._config_timer = QTimer(self)
+        self._config_timer.setSingleShot(True)
+        self._config_timer.setInterval(CONFIG_FLUSH_MS)
+        self._config_timer.timeout.connect(self.flush_config)
+
         # Load system and alignments into the combo box objects
         ui.image_title_combo.clear()
         ui.procedure_combo.clear()
         ui.procedure_combo.addItem('None')
         self.all_imager_names = [entry['imager'] for entry in
                                  self.loader.live_systems.values()]
-        for imager_name in self.all_imager_names:
-            ui.image_title_combo.addItem(imager_name)
-        for align in self.alignments.keys():
-            ui.procedure_combo.addItem(align)
+        ui.image_title_combo.addItems(self.all_imager_names)
+        ui.procedure_combo.addItems(list(self.alignments.keys()))
+        self._imager_name_to_index = {}
+        for i, imager_name in enumerate(self.all_imager_names):
+            self._imager_name_to_index.setdefault(imager_name, i)
 
         # Pick out some initial parameters from system and alignment dicts
         first_system_key = list(self.alignments.values())[0][0][0]
@@ -107,45 +115,37 @@ class SkywalkerGui(Display):
         # self.procedure and self.image_obj keep track of the gui state
         self.procedure = 'None'
         self.image_obj = first_imager
+        self._rebuild_active()
 
         # Initialize slit readback
-        self.slit_group = ObjWidgetGroup([ui.slit_x_width,
-                                          ui.slit_y_width,
-                                          ui.slit_x_setpoint,
-                                          ui.slit_y_setpoint,
-                                          ui.slit_circle],
-                                         ['xwidth.readback',
-                                          'ywidth.readback',
-                                          'xwidth.setpoint',
-                                          'ywidth.setpoint',
-                                          'xwidth.done'],
-                                         first_slit,
+        slit_widgets = [ui.slit_x_width, ui.slit_y_width,
+                        ui.slit_x_setpoint, ui.slit_y_setpoint,
+                        ui.slit_circle]
+        slit_attrs = ['xwidth.readback', 'ywidth.readback',
+                      'xwidth.setpoint', 'ywidth.setpoint',
+                      'xwidth.done']
+        self.slit_group = ObjWidgetGroup(slit_widgets, slit_attrs, first_slit,
                                          label=ui.readback_slits_title)
 
         # Initialize mirror control
         self.mirror_groups = []
-        mirror_labels = self.get_widget_set('mirror_name')
-        mirror_rbvs = self.get_widget_set('mirror_readback')
-        mirror_vals = self.get_widget_set('mirror_setpos')
-        mirror_circles = self.get_widget_set('mirror_circle')
         mirror_nominals = self.get_widget_set('move_nominal')
-        for label, rbv, val, circle, nom, mirror in zip(mirror_labels,
-                                                        mirror_rbvs,
-                                                        mirror_vals,
-                                                        mirror_circles,
-                                                        mirror_nominals,
-                                                        self.mirrors_padded()):
+        mirror_rows = zip(*(self.get_widget_set(name) for name in
+                            ('mirror_name', 'mirror_readback',
+                             'mirror_setpos', 'mirror_circle')))
+        mirror_attrs = ['pitch.user_readback', 'pitch.user_setpoint',
+                        'pitch.motor_done_move']
+        for (label, rbv, val, circle), nom, mirror in zip(
+                mirror_rows, mirror_nominals, self.mirrors_padded()):
             mirror_group = ObjWidgetGroup([rbv, val, circle, nom],
-                                          ['pitch.user_readback',
-                                           'pitch.user_setpoint',
-                                           'pitch.motor_done_move'],
-                                          mirror, label=label)
+                                          mirror_attrs, mirror, label=label)
             if mirror is None:
                 mirror_group.hide()
             self.mirror_groups.append(mirror_group)
 
         # Initialize the goal entry fields
         self.goals_groups = []
+        self._goals_values = None
         goal_labels = self.get_widget_set('goal_name')
         goal_edits = self.get_widget_set('goal_value')
         slit_checks = self.get_widget_set('slit_check')
@@ -177,31 +177,19 @@ class SkywalkerGui(Display):
                                         self, first_rotation)
         ui.image.setColorMapToPreset('jet')
 
-        # Initialize the settings window.
-        first_step = Setting('first_step', 6.0)
-        tolerance = Setting('tolerance', 5.0)
-        averages = Setting('averages', 100)
-        timeout = Setting('timeout', 600.0)
-        tol_scaling = Setting('tol_scaling', 8.0)
-        min_beam = Setting('min_beam', 1.0, required=False)
-        min_rate = Setting('min_rate', 1.0, required=False)
-        slit_width = Setting('slit_width', 0.2)
-        samples = Setting('samples', 100)
-        close_fee_att = Setting('close_fee_att', True)
-        self.settings = SettingsGroup(
-            parent=self,
-            collumns=[['alignment'], ['slits', 'suspenders', 'setup']],
-            alignment=[first_step, tolerance, averages, timeout, tol_scaling],
-            suspenders=[min_beam, min_rate],
-            slits=[slit_width, samples],
-            setup=[close_fee_att])
-        self.settings_cache = {}
+        # Initialize the settings. The window itself is only built the first
+        # time it is opened.
+        self.settings = None
+        self.settings_cache = {name: default for _, name, default, _
+                               in SETTINGS_DEFAULTS}
         self.load_settings()
-        self.restore_settings()
-        self.cache_settings()  # Required in case nothing is loaded
 
         # Create the RunEngine that will be used in the alignments.
         # This gives us the ability to pause, etc.
+        # bluesky and pswalker are imported where they are used so that
+        # importing this module stays cheap.
+        from bluesky import RunEngine
+        from bluesky.utils import install_qt_kicker
         self.RE = RunEngine({})
         install_qt_kicker()
 
@@ -212,7 +200,10 @@ class SkywalkerGui(Display):
         old_set = RunEngine.state._memory[self.RE].set_
         def new_set(state):  # NOQA
             old_set(state)
-            txt = " Status: " + state.capitalize()
+            try:
+                txt = STATUS_TEXT[state]
+            except KeyError:
+                txt = ' Status: ' + state.capitalize()
             self.ui.status_label.setText(txt)
         RunEngine.state._memory[self.RE].set_ = new_set
 
@@ -223,9 +214,10 @@ class SkywalkerGui(Display):
         imager_changed = ui.image_title_combo.currentIndexChanged[str]
         imager_changed.connect(self.on_image_combo_changed)
 
-        for goal_value in self.get_widget_set('goal_value'):
+        for goal_value in goal_edits:
             goal_changed = goal_value.editingFinished
             goal_changed.connect(self.on_goal_changed)
+            goal_value.textChanged.connect(self.on_goal_text_changed)
 
         start_pressed = ui.start_button.clicked
         start_pressed.connect(self.on_start_button)
@@ -252,10 +244,13 @@ class SkywalkerGui(Display):
             nominal_pressed = nominal_button.clicked
             nominal_pressed.connect(partial(self.on_move_nominal_button, i))
 
-        self.cam_lock = RLock()
+        self.cam_lock = Lock()
+        self.auto_switch_cam = False
+        self._cam_subscribed = set()
 
         # Store some info about our screen size.
         QApp = QCoreApplication.instance()
+        QApp.aboutToQuit.connect(self.flush_config)
         desktop = QApp.desktop()
         geometry = desktop.screenGeometry()
         self.screen_size = (geometry.width(), geometry.height())
@@ -268,11 +263,15 @@ class SkywalkerGui(Display):
         post_init.post_init.connect(self.on_post_init)
 
         # Setup the on-screen logger
-        console = self.setup_gui_logger()
+        self.console = self.setup_gui_logger()
 
-        # Stop the run if we get closed
-        close_dict = dict(RE=self.RE, console=console)
-        self.destroyed.connect(partial(SkywalkerGui.on_close, close_dict))
+        # Stop the run if we get closed. A Display hosted in a pydm main
+        # window never gets a closeEvent, so also hook destroyed and quit.
+        self._close_dict = dict(RE=self.RE, console=self.console,
+                                log_listener=self._log_listener)
+        on_close = partial(SkywalkerGui.on_close, self._close_dict)
+        self.destroyed.connect(on_close)
+        QApp.aboutToQuit.connect(on_close)
 
         # Put out the initialization message.
         init_base = 'Skywalker GUI initialized in '
@@ -295,6 +294,7 @@ class SkywalkerGui(Display):
         # Load files needed during __init__
         self.load_system()
         self.load_alignments()
+        self.load_config()
 
     def get_cfg_path(self, name):
         if self.sim:
@@ -311,9 +311,7 @@ class SkywalkerGui(Display):
         if self.sim:
             self.alignments = sim_alignments
         else:
-            with open(self.alignment_config, 'r') as f:
-                d = json.load(f)
-                self.alignments = d
+            self.alignments = read_json(self.alignment_config)
 
     @pyqtSlot()
     def on_post_init(self):
@@ -321,15 +319,63 @@ class SkywalkerGui(Display):
         y = min(self.preferred_size[1], self.screen_size[1])
         self.window().resize(x, y)
 
-    # Close handler needs to be a static class method because it is run after
-    # the object instance is already completely gone
+    def closeEvent(self, event):
+        """
+        Stop the run and shut down our loggers when the window is closed.
+        """
+        SkywalkerGui.on_close(self._close_dict)
+        super().closeEvent(event)
+
+    # Close handler needs to be a static class method because it may run
+    # from destroyed, after the object instance is already completely gone
     @staticmethod
     def on_close(close_dict):
-        RE = close_dict['RE']
-        console = close_dict['console']
-        console.close()
-        if RE.state != 'idle':
-            RE.abort()
+        """
+        Abort the run first so its log records still reach both loggers,
+        then close the on-screen logger and stop the file log listener.
+        Each step runs only once, however many close hooks fire.
+        """
+        RE = close_dict.pop('RE', None)
+        if RE is not None and RE.state != 'idle':
+            try:
+                RE.abort()
+            except Exception:
+                logger.exception('Error aborting the run on close')
+        console = close_dict.pop('console', None)
+        if console is not None:
+            console.close()
+        log_listener = close_dict.pop('log_listener', None)
+        if log_listener is not None:
+            log_listener.stop()
+
+    def setup_file_logger(self):
+        """
+        Send all log messages to the debug file. Records are handed to a
+        background thread through a queue so that logging calls never wait on
+        the disk. Like logging.basicConfig, this does nothing if the root
+        logger already has handlers.
+
+        Returns
+        -------
+        listener: QueueListener or None
+            The running listener that writes the file, if one was started
+        """
+        root = logging.getLogger('')
+        if root.handlers:
+            return None
+        file_handler = logging.FileHandler('./skywalker_debug.log', mode='a')
+        formatter = logging.Formatter(fmt=('%(asctime)s '
+                                           '%(name)-12s '
+                                           '%(levelname)-8s '
+                                           '%(message)s'),
+                                      datefmt='%m-%d %H:%M:%S')
+        file_handler.setFormatter(formatter)
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, file_handler)
+        listener.start()
+        root.addHandler(CopyQueueHandler(log_queue))
+        root.setLevel(logging.DEBUG)
+        return listener
 
     def setup_gui_logger(self):
         """
@@ -364,21 +410,25 @@ class SkywalkerGui(Display):
             # Assume that imagers have exactly one slit and one rotation
             # Therefore, we can pick an arbitrary system entry that includes
             # the imager
-            objs = self.loader.get_subsystem(systems[0])
+            objs = self.load_subsystem(systems[0])
             # This may have entries or may be missing entries if there was a
             # problem.
             try:
                 image_obj = objs['imager']
                 rotation = objs.get('rotation', 0)
-                self.image_obj = image_obj
-                self.image_group.change_obj(image_obj, rotation=rotation)
+                # Reconnecting the image is expensive, skip it if nothing
+                # would change
+                if (image_obj is not self.image_group.obj or
+                        rotation != self.image_group.rotation):
+                    self.image_obj = image_obj
+                    self.image_group.change_obj(image_obj, rotation=rotation)
             except KeyError:
                 logger.error('Failed to connect to imager')
             # Slits wasn't a mandatory field.
             slits_obj = objs.get('slits')
             if slits_obj is not None:
                 self.slit_group.change_obj(slits_obj)
-        except:
+        except Exception:
             logger.exception('Error on selecting imager')
 
     @pyqtSlot(str)
@@ -396,33 +446,44 @@ class SkywalkerGui(Display):
         try:
             logger.info('Selecting procedure %s', procedure_name)
             self.procedure = procedure_name
+            self._rebuild_active()
             if procedure_name == 'None':
                 return
-            else:
-                self.load_active_system()
-            for obj, widgets in zip(self.mirrors_padded(), self.mirror_groups):
-                if obj is None:
-                    widgets.hide()
-                    widgets.change_obj(None)
-                else:
-                    widgets.change_obj(obj)
-                    widgets.show()
-            for obj, widgets in zip(self.imagers_padded(), self.goals_groups):
-                widgets.save_value()
-                widgets.clear()
-            for obj, slit, widgets in zip(self.imagers_padded(),
-                                          self.slits_padded(),
-                                          self.goals_groups):
-                if obj is None:
-                    widgets.hide()
-                else:
-                    widgets.setup(name=obj.name)
-                    if slit is None:
-                        widgets.checkbox.setEnabled(False)
+            # Hold off repaints and goal edit signals until every row has
+            # been swapped over
+            self.setUpdatesEnabled(False)
+            for goal_group in self.goals_groups:
+                goal_group.line_edit.blockSignals(True)
+            try:
+                # Every old goal must be stashed before any new goal is loaded,
+                # since a goal can move to a different row
+                for goal_group in self.goals_groups:
+                    goal_group.save_value()
+                    goal_group.clear()
+                for mirror, img, slit, mirror_group, goal_group in zip(
+                        self.mirrors_padded(), self.imagers_padded(),
+                        self.slits_padded(), self.mirror_groups,
+                        self.goals_groups):
+                    if mirror is None:
+                        mirror_group.hide()
+                        mirror_group.change_obj(None)
+                    else:
+                        mirror_group.change_obj(mirror)
+                        mirror_group.show()
+                    if img is None:
+                        goal_group.hide()
                     else:
-                        widgets.checkbox.setEnabled(True)
-                    widgets.show()
-        except:
+                        goal_group.setup(name=img.name)
+                        goal_group.checkbox.setEnabled(slit is not None)
+                        goal_group.show()
+            finally:
+                for goal_group in self.goals_groups:
+                    goal_group.line_edit.blockSignals(False)
+                self.setUpdatesEnabled(True)
+            # The goal edits were silenced, so refresh once by hand
+            self._goals_values = None
+            self.image_group.update_deltas()
+        except Exception:
             logger.exception('Error on selecting procedure')
 
     @pyqtSlot()
@@ -433,9 +494,17 @@ class SkywalkerGui(Display):
         """
         try:
             self.image_group.update_deltas()
-        except:
+        except Exception:
             logger.exception('Error on changing goal')
 
+    @pyqtSlot()
+    def on_goal_text_changed(self):
+        """
+        Slot for any change to a goal's text, including programmatic ones.
+        Marks the parsed goals as stale.
+        """
+        self._goals_values = None
+
     @pyqtSlot()
     def on_start_button(self):
         """
@@ -463,14 +532,14 @@ class SkywalkerGui(Display):
 
                 logger.info("Starting %s procedure with goals %s",
                             self.procedure, raw_goals)
-                self.install_pick_cam()
-                self.auto_switch_cam = True
+                from pswalker.skywalker import skywalker
+                self.enable_cam_autoswitch()
                 alignment = self.alignments[self.procedure]
                 for key_set in alignment:
-                    yags = [self.loader[key]['imager'] for key in key_set]
-                    mots = [self.loader[key]['mirror'] for key in key_set]
-                    rots = [self.loader[key].get('rotation')
-                            for key in key_set]
+                    subsystems = [self.loader[key] for key in key_set]
+                    yags = [sub['imager'] for sub in subsystems]
+                    mots = [sub['mirror'] for sub in subsystems]
+                    rots = [sub.get('rotation') for sub in subsystems]
 
                     # Make sure nominal positions are correct
                     for mot in mots:
@@ -483,15 +552,18 @@ class SkywalkerGui(Display):
                     # We need to select det_rbv and interpret goals based on
                     # the camera rotation, converting things to the unrotated
                     # coordinates.
+                    # Temporary fix: undo skywalker's goal mangling with the
+                    # 480 - goal below.
+                    # TODO remove goal mangling from skywalker.
                     det_rbv = []
                     goals = []
                     for rot, yag, goal in zip(rots, yags, raw_goals):
-                        rot_info = ad_stats_x_axis_rot(yag, rot)
+                        rot_info = self.rot_info(yag, rot)
                         det_rbv.append(rot_info['key'])
                         modifier = rot_info['mod_x']
                         if modifier is not None:
                             goal = modifier - goal
-                        goals.append(goal)
+                        goals.append(480 - goal)
                     first_steps = self.settings_cache['first_step']
                     tolerances = self.settings_cache['tolerance']
                     average = self.settings_cache['averages']
@@ -503,9 +575,6 @@ class SkywalkerGui(Display):
                     if close_fee_att and not self.sim:
                         extra_stage.append(self.fee_att())
 
-                    # Temporary fix: undo skywalker's goal mangling.
-                    # TODO remove goal mangling from skywalker.
-                    goals = [480 - g for g in goals]
                     plan = skywalker(yags, mots, det_rbv, mot_rbv, goals,
                                      first_steps=first_steps,
                                      tolerances=tolerances,
@@ -517,13 +586,12 @@ class SkywalkerGui(Display):
                     self.RE(plan)
             elif self.RE.state == 'paused':
                 logger.info("Resuming procedure.")
-                self.install_pick_cam()
-                self.auto_switch_cam = True
+                self.enable_cam_autoswitch()
                 self.RE.resume()
-        except:
+        except Exception:
             logger.exception('Error in running procedure')
         finally:
-            self.auto_switch_cam = False
+            self.disable_cam_autoswitch()
 
     @pyqtSlot()
     def on_pause_button(self):
@@ -531,12 +599,12 @@ class SkywalkerGui(Display):
         Slot for the pause button. This brings us from the running state to the
         paused state.
         """
-        self.auto_switch_cam = False
+        self.disable_cam_autoswitch()
         if self.RE.state == 'running':
             logger.info("Pausing procedure.")
             try:
                 self.RE.request_pause()
-            except:
+            except Exception:
                 logger.exception("Error on pause.")
 
     @pyqtSlot()
@@ -545,12 +613,12 @@ class SkywalkerGui(Display):
         Slot for the abort button. This brings us from any state to the idle
         state.
         """
-        self.auto_switch_cam = False
+        self.disable_cam_autoswitch()
         if self.RE.state != 'idle':
             logger.info("Aborting procedure.")
             try:
                 self.RE.abort()
-            except:
+            except Exception:
                 logger.exception("Error on abort.")
 
     @pyqtSlot()
@@ -564,27 +632,28 @@ class SkywalkerGui(Display):
             slits_to_check = []
 
             # First, check the slit checkboxes.
-            for img_obj, slit_obj, goal_group in zip(self.imagers_padded(),
-                                                     self.slits_padded(),
-                                                     self.goals_groups):
-                if slit_obj is not None and goal_group.is_checked:
-                    image_to_check.append(img_obj)
-                    slits_to_check.append(slit_obj)
+            imagers = self.imagers_padded()
+            slits = self.slits_padded()
+            for i in self._slit_slots:
+                if self.goals_groups[i].is_checked:
+                    image_to_check.append(imagers[i])
+                    slits_to_check.append(slits[i])
             if not slits_to_check:
                 logger.info('No valid slits selected!')
                 return
             logger.info('Checking the following slits: %s',
                         [slit.name for slit in slits_to_check])
+            from bluesky.preprocessors import run_wrapper, stage_wrapper
+            from pswalker.plan_stubs import slit_scan_fiducialize
 
-            self.install_pick_cam()
-            self.auto_switch_cam = True
+            self.enable_cam_autoswitch()
 
             slit_width = self.settings_cache['slit_width']
             samples = self.settings_cache['samples']
 
             def plan(img, slit, rot, output_obj, slit_width=slit_width,
                      samples=samples):
-                rot_info = ad_stats_x_axis_rot(img, rot)
+                rot_info = self.rot_info(img, rot)
                 det_rbv = rot_info['key']
                 fidu = slit_scan_fiducialize(slit, img, centroid=det_rbv,
                                              x_width=slit_width,
@@ -599,7 +668,7 @@ class SkywalkerGui(Display):
             results = {}
             for img, slit in zip(image_to_check, slits_to_check):
                 systems = self.loader.get_systems_with(img.name)
-                objs = self.loader.get_subsystem(systems[0])
+                objs = self.load_subsystem(systems[0])
                 rotation = objs.get('rotation', 0)
                 this_plan = plan(img, slit, rotation, results)
                 wrapped = run_wrapper(this_plan)
@@ -609,16 +678,13 @@ class SkywalkerGui(Display):
             logger.info('Slit scan found the following goals: %s', results)
             if self.ui.slit_fill_check.isChecked():
                 logger.info('Filling goal fields automatically.')
-                for img, fld in zip(self.imagers_padded(), self.goals_groups):
-                    if img is not None:
-                        try:
-                            fld.value = round(results[img.name], 1)
-                        except KeyError:
-                            pass
-        except:
+                for name, result in results.items():
+                    for i in self._imager_slots.get(name, ()):
+                        self.goals_groups[i].value = round(result, 1)
+        except Exception:
             logger.exception('Error on slits button')
         finally:
-            self.auto_switch_cam = False
+            self.disable_cam_autoswitch()
 
     @pyqtSlot()
     def on_save_mirrors_button(self):
@@ -629,7 +695,7 @@ class SkywalkerGui(Display):
                 logger.info('Saving mirror positions.')
                 self.save_active_mirrors()
                 self.cache_config()
-        except:
+        except Exception:
             logger.exception('Error on saving mirrors')
 
     @pyqtSlot()
@@ -638,14 +704,14 @@ class SkywalkerGui(Display):
             logger.info('Saving goals.')
             self.save_active_goals()
             self.cache_config()
-        except:
+        except Exception:
             logger.exception('Error on saving goals')
 
     @pyqtSlot()
     def on_settings_button(self):
         try:
             pos = self.ui.mapToGlobal(self.settings_button.pos())
-            dialog_return = self.settings.dialog_at(pos)
+            dialog_return = self.settings_group().dialog_at(pos)
             if dialog_return == QDialog.Accepted:
                 self.cache_settings()
                 self.save_settings()
@@ -653,13 +719,13 @@ class SkywalkerGui(Display):
             elif dialog_return == QDialog.Rejected:
                 self.restore_settings()
                 logger.info('Changes to settings cancelled.')
-        except:
+        except Exception:
             logger.exception('Error on opening settings')
 
     @pyqtSlot(int)
     def on_move_nominal_button(self, index):
         try:
-            nominal_positions = self.read_config() or {}
+            nominal_positions = self._config_dict
             try:
                 mirror = self.mirrors()[index]
             except IndexError:
@@ -679,6 +745,8 @@ class SkywalkerGui(Display):
         """
         Set up the RunEngine for the current cached settings.
         """
+        from pswalker.suspenders import (BeamEnergySuspendFloor,
+                                         BeamRateSuspendFloor)
         self.RE.clear_suspenders()
         min_beam = self.settings_cache['min_beam']
         min_rate = self.settings_cache['min_rate']
@@ -688,14 +756,40 @@ class SkywalkerGui(Display):
         if min_rate is not None:
             self.RE.install_suspender(BeamRateSuspendFloor(min_rate, sleep=5))
 
+    def rot_info(self, imager, rotation):
+        """
+        ad_stats_x_axis_rot for an imager at a given rotation. The layout for
+        each rotation is a fixed table lookup, but the modifiers come from the
+        camera's array size, which binning or a ROI can change, so this is
+        read again on every call.
+        """
+        return ad_stats_x_axis_rot(imager, rotation)
+
     def fee_att(self):
         try:
             att = self._fee_att
         except AttributeError:
+            from pcdsdevices.epics.attenuator import FeeAtt
             att = FeeAtt()
             self._fee_att = att
         return att
 
+    def settings_group(self):
+        """
+        The settings window, created from SETTINGS_DEFAULTS the first time it
+        is needed and filled in from the local cache.
+        """
+        if self.settings is None:
+            headers = {}
+            for header, name, default, required in SETTINGS_DEFAULTS:
+                setting = Setting(name, default, required=required)
+                headers.setdefault(header, []).append(setting)
+            self.settings = SettingsGroup(parent=self,
+                                          collumns=SETTINGS_COLUMNS,
+                                          **headers)
+            self.restore_settings()
+        return self.settings
+
     def cache_settings(self):
         """
         Pull settings from the settings object to the local cache.
@@ -720,72 +814,105 @@ class SkywalkerGui(Display):
         """
         pass
 
-    def install_pick_cam(self):
+    def enable_cam_autoswitch(self):
         """
         For every camera that we've successfully loaded, subscribe the pick_cam
-        method if we haven't done so already.
+        method and turn on automatic camera switching.
         """
-        try:
-            installed = self.installed
-        except AttributeError:
-            installed = set()
-            self.installed = installed
         for system in self.loader.cache.values():
             imager = system['imager']
-            if imager not in installed:
+            if imager not in self._cam_subscribed:
                 imager.subscribe(self.pick_cam, event_type=imager.SUB_STATE,
                                  run=False)
-                installed.add(imager)
+                self._cam_subscribed.add(imager)
+        self.auto_switch_cam = True
+
+    def disable_cam_autoswitch(self):
+        """
+        Turn off automatic camera switching and drop the pick_cam
+        subscriptions so idle imager updates cost nothing.
+        """
+        self.auto_switch_cam = False
+        for imager in self._cam_subscribed:
+            imager.clear_sub(self.pick_cam)
+        self._cam_subscribed.clear()
 
     def pick_cam(self, *args, **kwargs):
         """
         Callback to switch the active imager as the procedures progress.
         """
         if self.auto_switch_cam:
-            with self.cam_lock:
-                chosen_imager = None
-                for img in self.imagers():
-                    pos = img.position
-                    if pos == "Unknown":
-                        return
-                    elif pos == "IN":
-                        chosen_imager = img
-                        break
-                combo = self.ui.image_title_combo
-                if chosen_imager is not None:
-                    name = chosen_imager.name
+            chosen_imager = None
+            for img in self.imagers():
+                pos = img.position
+                if pos == "Unknown":
+                    return
+                elif pos == "IN":
+                    chosen_imager = img
+                    break
+            if chosen_imager is None:
+                return
+            name = chosen_imager.name
+            combo = self.ui.image_title_combo
+            if name != combo.currentText():
+                # Only the switch itself needs to be serialized
+                with self.cam_lock:
                     if name != combo.currentText():
                         logger.info('Automatically switching cam to %s', name)
-                        index = self.all_imager_names.index(name)
+                        index = self._imager_name_to_index[name]
                         combo.setCurrentIndex(index)
 
     def read_config(self):
         if self.nominal_config is not None:
             try:
-                with open(self.nominal_config, 'r') as f:
-                    d = json.load(f)
-            except:
+                d = read_json(self.nominal_config)
+            except Exception:
                 return None
             return d
         return None
 
     def save_config(self, d):
         if self.nominal_config is not None:
-            with open(self.nominal_config, 'w') as f:
-                json.dump(d, f)
+            write_json(self.nominal_config, d)
+
+    def load_config(self):
+        """
+        Read the nominal config from disk once. Afterwards, the in-memory copy
+        is kept in sync with the file by update_config.
+        """
+        self._config_dict = self.read_config() or {}
+        self._config_dirty = False
+
+    def update_config(self, entries):
+        """
+        Merge entries into the nominal config. If a value actually changed,
+        schedule a write to disk, so that several saves in a row only write
+        the file once.
+        """
+        for key, value in entries.items():
+            if self._config_dict.get(key) != value:
+                self._config_dict[key] = value
+                self._config_dirty = True
+        if self._config_dirty:
+            self._config_timer.start()
+
+    @pyqtSlot()
+    def flush_config(self):
+        """
+        Write the nominal config to disk if there are unsaved changes.
+        """
+        if self._config_dirty:
+            self.save_config(self._config_dict)
+            self._config_dirty = False
 
     def cache_config(self):
-        d = self.read_config()
-        if d is not None:
-            self.config_cache.update(d)
+        self.config_cache.update(self._config_dict)
 
     def save_goal(self, goal_group):
         if goal_group.value is None:
             logger.info('No value to save for this goal.')
             return
-        d = self.read_config() or {}
-        d[goal_group.text()] = goal_group.value
-        self.save_config(d)
+        self.update_config({goal_group.text(): goal_group.value})
 
     def save_active_goals(self):
         text = []
@@ -797,16 +924,11 @@ class SkywalkerGui(Display):
             if val is not None:
                 values.append(val)
                 text.append(goal_group.text())
-        d = self.read_config() or {}
-        for t, v in zip(text, values):
-            d[t] = v
-        self.save_config(d)
+        self.update_config(dict(zip(text, values)))
 
     def save_mirror(self, mirror_group):
-        d = self.read_config() or {}
         mirror = mirror_group.obj
-        d[mirror.name] = mirror.position
-        self.save_config(d)
+        self.update_config({mirror.name: mirror.position})
 
     def save_active_mirrors(self):
         saves = {}
@@ -818,24 +940,65 @@ class SkywalkerGui(Display):
             for mirror in all_mirrors:
                 saves[mirror.name] += mirror.position/averages
         logger.info('Saving positions: %s', saves)
-        read = self.read_config() or {}
-        read.update(saves)
-        self.save_config(read)
+        self.update_config(saves)
 
-    def active_system(self):
+    def _rebuild_active(self):
         """
-        List of system keys that are part of the active procedure.
+        Load the systems for the active procedure and cache the lists of
+        system keys and devices. Called whenever the procedure changes.
         """
         active_system = []
         if self.procedure != 'None':
             for part in self.alignments[self.procedure]:
                 active_system.extend(part)
-        return active_system
+        self._active_system = active_system
+        self.load_active_system()
+        self._cache_active_objs()
+
+    def _cache_active_objs(self):
+        """
+        Cache the device lists of the active systems from the loaded
+        subsystems, noting which systems have not loaded yet.
+        """
+        self._missing_systems = {act for act in self.active_system()
+                                 if self.loader[act] is None}
+        self._active_mirrors = self._objs('mirror')
+        self._active_imagers = self._objs('imager')
+        self._active_slits = self._objs('slits')
+        self._mirrors_padded = self.none_pad(self._active_mirrors)
+        self._imagers_padded = self.none_pad(self._active_imagers)
+        self._slits_padded = self.none_pad(self._active_slits)
+        self._slit_slots = [i for i, slit in enumerate(self._slits_padded)
+                            if slit is not None]
+        self._imager_index = {}
+        self._imager_slots = {}
+        for i, img in enumerate(self._imagers_padded):
+            self._imager_index.setdefault(img, i)
+            if img is not None:
+                self._imager_slots.setdefault(img.name, []).append(i)
+
+    def active_system(self):
+        """
+        List of system keys that are part of the active procedure.
+        """
+        return self._active_system
 
     def load_active_system(self):
         for system in self.active_system():
             self.loader.get_subsystem(system)
 
+    def load_subsystem(self, system):
+        """
+        Load a subsystem through the loader. If this is an active system that
+        failed to load before, the cached device lists are rebuilt to
+        include it.
+        """
+        objs = self.loader.get_subsystem(system)
+        if (system in self._missing_systems and
+                self.loader[system] is not None):
+            self._cache_active_objs()
+        return objs
+
     def _objs(self, key):
         objs = []
         for act in self.active_system():
@@ -850,26 +1013,28 @@ class SkywalkerGui(Display):
         """
         List of active mirror objects.
         """
-        return self._objs('mirror')
+        return self._active_mirrors
 
     def imagers(self):
         """
         List of active imager objects.
         """
-        return self._objs('imager')
+        return self._active_imagers
 
     def slits(self):
         """
         List of active slits objects.
         """
-        return self._objs('slits')
+        return self._active_slits
 
     def goals(self):
         """
         List of goals in the user entry boxes, or None for empty or invalid
-        goals.
+        goals. The parsed list is reused until any goal text changes.
         """
-        return [goal.value for goal in self.goals_groups]
+        if self._goals_values is None:
+            self._goals_values = [goal.value for goal in self.goals_groups]
+        return self._goals_values
 
     def goal(self):
         """
@@ -887,30 +1052,25 @@ class SkywalkerGui(Display):
         Goal index of the active imager, or None if the visible imager is not
         part of the active procedure.
         """
-        try:
-            return self.imagers_padded().index(self.image_obj)
-        except ValueError:
-            return None
+        return self._imager_index.get(self.image_obj)
 
     def none_pad(self, obj_list):
         """
         Helper function to extend a list with 'None' objects until it's the
         length of MAX_MIRRORS.
         """
-        padded = []
-        padded.extend(obj_list)
-        while len(padded) < MAX_MIRRORS:
-            padded.append(None)
+        padded = list(obj_list)
+        padded.extend(NONE_PAD[len(padded):])
         return padded
 
     def mirrors_padded(self):
-        return self.none_pad(self.mirrors())
+        return self._mirrors_padded
 
     def imagers_padded(self):
-        return self.none_pad(self.imagers())
+        return self._imagers_padded
 
     def slits_padded(self):
-        return self.none_pad(self.slits())
+        return self._slits_padded
 
     def get_widget_set(self, name, num=MAX_MIRRORS):
         """
@@ -929,11 +1089,19 @@ class SkywalkerGui(Display):
         -------
         widget_set: list
             List of widgets e.g. 'name_1', 'name_2', 'name_3'...
+            The same list is returned on every call, do not modify it.
         """
-        widgets = []
-        for n in range(1, num + 1):
-            widget = getattr(self.ui, name + "_" + str(n))
-            widgets.append(widget)
+        try:
+            widget_sets = self._widget_sets
+        except AttributeError:
+            widget_sets = self._widget_sets = {}
+        try:
+            return widget_sets[name, num]
+        except KeyError:
+            pass
+        widgets = [getattr(self.ui, '{}_{}'.format(name, n))
+                   for n in range(1, num + 1)]
+        widget_sets[name, num] = widgets
         return widgets
 
     def ui_filename(self):
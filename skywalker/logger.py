@@ -1,31 +1,168 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import copy
+import time
+import queue
 import threading
 import logging
+from logging.handlers import QueueHandler
 
-from pydm.PyQt.QtCore import QObject, QPoint, pyqtSlot, pyqtSignal
+from pydm.PyQt.QtCore import Qt, QObject, pyqtSlot, pyqtSignal
+from pydm.PyQt.QtGui import QTextCursor
 
 
-class GuiHandler(logging.Handler):
+class CopyQueueHandler(QueueHandler):
+    """
+    QueueHandler that formats a copy of the record. Before Python 3.8 the
+    base class edits the record in place, which would hand the next handler
+    an already formatted message.
+    """
+    def prepare(self, record):
+        return super().prepare(copy.copy(record))
+
+
+class GuiHandler(QueueHandler):
     """
     Logging handler that logs to a scrolling text widget.
+
+    Records are put on a queue and written to the widget from a background
+    listener, so logging from any thread never waits on the gui. If the queue
+    is full the record is dropped and counted instead.
     """
-    def __init__(self, text_widget, level=logging.NOTSET):
-        super().__init__(level=level)
-        self.log_writer = LogWriter(text_widget)
-        self.lock = threading.RLock()
+    max_queue = 10000
 
-    def emit(self, record):
-        with self.lock:
-            if self.log_writer is not None:
-                all_msg = self.format(record)
-                self.log_writer.do_write(all_msg)
+    def __init__(self, text_widget, level=logging.INFO, max_lines=5000):
+        super().__init__(queue.Queue(maxsize=self.max_queue))
+        self.setLevel(level)
+        self.dropped = 0
+        self.log_writer = LogWriter(text_widget, max_lines=max_lines)
+        self.listener = _GuiListener(self.queue, self)
+        self.listener.start()
+
+    def enqueue(self, record):
+        # Nothing reads the queue once we are closed
+        if self.log_writer is None:
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record):
+        # Formatting happens in the listener, only for records that get shown.
+        # Records below our level never get here, Logger.callHandlers checks
+        # the level first. Copy so that formatting in the listener cannot
+        # race with other handlers on the same record.
+        return copy.copy(record)
+
+    def take_dropped(self):
+        """
+        Return the number of dropped records and reset the count.
+        """
+        self.acquire()
+        try:
+            dropped = self.dropped
+            self.dropped = 0
+        finally:
+            self.release()
+        return dropped
 
     def close(self):
-        with self.lock:
-            if self.log_writer is not None:
-                self.log_writer.log_close()
-                self.log_writer = None
+        if self.log_writer is not None:
+            self.listener.stop()
+            self.log_writer.log_close()
+            self.log_writer = None
+        super().close()
+
+
+class _GuiListener:
+    """
+    Background thread that drains the handler's queue and sends the messages
+    to the LogWriter in batches, so a burst of records costs one gui update
+    instead of many.
+    """
+    batch_size = 128
+    flush_interval = 0.05
+    drop_interval = 1
+    _sentinel = None
+
+    def __init__(self, log_queue, handler):
+        self.queue = log_queue
+        self.handler = handler
+        self.log_writer = handler.log_writer
+        self.has_task_done = hasattr(log_queue, 'task_done')
+        self.next_drop_check = 0
+        self._thread = None
+
+    def start(self):
+        """
+        Start the thread that reads the queue.
+        """
+        self._thread = threading.Thread(target=self._run,
+                                        name='GuiLogListener', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Write out everything already queued, then end the thread.
+        """
+        if self._thread is not None:
+            # Wait for room, a full queue must not keep us from stopping
+            self.queue.put(self._sentinel)
+            self._thread.join()
+            self._thread = None
+
+    def dequeue(self, timeout=None):
+        """
+        Take the next item off the queue, raising queue.Empty if nothing
+        arrives within timeout.
+        """
+        return self.queue.get(timeout=timeout)
+
+    def _run(self):
+        batch = []
+        deadline = None
+        while True:
+            if batch:
+                timeout = deadline - time.monotonic()
+                try:
+                    if timeout <= 0:
+                        raise queue.Empty
+                    record = self.dequeue(timeout=timeout)
+                except queue.Empty:
+                    self.flush(batch)
+                    batch = []
+                    continue
+            else:
+                record = self.dequeue()
+                deadline = time.monotonic() + self.flush_interval
+            try:
+                if record is self._sentinel:
+                    break
+                try:
+                    batch.append(self.handler.format(record))
+                except Exception:
+                    self.handler.handleError(record)
+            finally:
+                if self.has_task_done:
+                    self.queue.task_done()
+            if len(batch) >= self.batch_size:
+                self.flush(batch)
+                batch = []
+        if batch:
+            self.flush(batch)
+
+    def flush(self, batch):
+        now = time.monotonic()
+        if now >= self.next_drop_check:
+            self.next_drop_check = now + self.drop_interval
+            dropped = self.handler.take_dropped()
+            if dropped:
+                record = logging.makeLogRecord(dict(
+                    levelno=logging.WARNING, levelname='WARNING',
+                    msg='Dropped {} log messages'.format(dropped)))
+                batch.append(self.handler.format(record))
+        self.log_writer.do_write(batch)
 
 
 class LogWriter(QObject):
@@ -33,23 +170,40 @@ class LogWriter(QObject):
     QObject to do the writing
     """
     terminator = '\n'
-    write_trigger = pyqtSignal(str)
+    write_trigger = pyqtSignal(list)
 
-    def __init__(self, text_widget):
+    def __init__(self, text_widget, max_lines=5000):
         super().__init__(parent=text_widget)
         self.text_widget = text_widget
-        self.write_trigger.connect(self.write_log)
+        self.max_lines = max_lines
+        self.cursor = QTextCursor(text_widget.document())
+        self.write_trigger.connect(self.write_log, Qt.QueuedConnection)
 
-    def do_write(self, all_msg):
-        self.write_trigger.emit(all_msg)
+    def do_write(self, messages):
+        self.write_trigger.emit(messages)
 
-    @pyqtSlot(str)
-    def write_log(self, all_msg):
+    @pyqtSlot(list)
+    def write_log(self, messages):
+        """
+        Put messages at the top of the widget, newest first, in one insert.
+        The oldest lines at the bottom are removed past max_lines.
+        """
         if self.text_widget is not None:
-            split_msg = all_msg.split(self.terminator)
-            for msg in reversed(split_msg):
-                cursor = self.text_widget.cursorForPosition(QPoint(0, 0))
-                cursor.insertText(msg + self.terminator)
+            text = self.terminator.join(reversed(messages))
+            self.text_widget.setUpdatesEnabled(False)
+            try:
+                doc = self.text_widget.document()
+                cursor = self.cursor
+                cursor.movePosition(QTextCursor.Start)
+                cursor.insertText(text + self.terminator)
+                extra = doc.blockCount() - self.max_lines
+                if extra > 0:
+                    cursor.movePosition(QTextCursor.End)
+                    cursor.movePosition(QTextCursor.PreviousBlock,
+                                        QTextCursor.KeepAnchor, extra)
+                    cursor.removeSelectedText()
+            finally:
+                self.text_widget.setUpdatesEnabled(True)
 
     def log_close(self):
         self.text_widget = None
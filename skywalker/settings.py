@@ -2,23 +2,30 @@
 # -*- coding: utf-8 -*-
 import logging
 
-from pydm.PyQt.QtCore import Qt
+from pydm.PyQt.QtCore import Qt, QObject, pyqtSignal, pyqtSlot
 from pydm.PyQt.QtGui import (QDialog, QSpacerItem, QSizePolicy,
-                             QFormLayout, QHBoxLayout, QVBoxLayout,
+                             QGridLayout, QHBoxLayout, QVBoxLayout,
                              QLabel, QLineEdit, QComboBox, QCheckBox,
                              QPushButton,
                              QIntValidator, QDoubleValidator)
 
 logger = logging.getLogger(__name__)
 
+# Validator used for each numeric Setting data type
+_VALIDATORS = {int: QIntValidator, float: QDoubleValidator}
+# Text parser used for each Setting data type, other types are called as-is
+_PARSERS = {int: int, float: float, str: str,
+            bool: lambda raw: raw in ('True', 'true', '1')}
 
-class Setting:
+
+class Setting(QObject):
     """
     Abstraction of a Single user input setting. Handles what the ui should look
     like for just this setting and keeps the input value and display values in
     sync.
 
-    Widgets are held in the "layout" attribute.
+    Widgets are held in the "check" and "data" attributes and are placed into
+    a parent grid with :meth:`.attach_to_grid`.
 
     Supports several different kinds of configurations and associated values:
         -Just a checkbox:
@@ -33,15 +40,21 @@ class Setting:
         -A checkbox and a line edit or combo box
             Chosen if required=False and default is non-boolean
             If the checkbox is unchecked, the value is None
+
+    Every change to the widgets updates the cached value and emits "edited".
     """
     NO_CONFIG = 0
     CHECK = 1
     LINE = 2
     COMBO = 4
+    edited = pyqtSignal()
 
     def __init__(self, name, default, required=True, enum=None):
+        super().__init__()
         self.name = name
         self.data_type = type(default)
+        self._parse = _PARSERS.get(self.data_type, self.data_type)
+        self._cached_value = default
         self.config = self.NO_CONFIG
 
         if not required or isinstance(default, bool):
@@ -52,10 +65,8 @@ class Setting:
             else:
                 self.config += self.COMBO
 
-        self.layout = QHBoxLayout()
         if self.config & self.CHECK:
             self.check = QCheckBox()
-            self.layout.addWidget(self.check)
         else:
             self.check = None
         if self.config == self.CHECK:
@@ -63,18 +74,16 @@ class Setting:
         if self.config & self.LINE:
             self.data = QLineEdit()
             self.data.setText(str(default))
-            if self.data_type == int:
-                self.data.setValidator(QIntValidator())
-            elif self.data_type == float:
-                self.data.setValidator(QDoubleValidator())
-            self.layout.addWidget(self.data)
+            validator = _VALIDATORS.get(self.data_type)
+            if validator is not None:
+                self.data.setValidator(validator(self.data))
         elif self.config & self.COMBO:
             self.data = QComboBox()
-            for value in enum:
-                self.data.addItem(str(value))
+            self.data.setUpdatesEnabled(False)
+            self.data.addItems([str(value) for value in enum])
+            self.data.setUpdatesEnabled(True)
             if default is not None:
                 pass  # TODO: pick correct default combo box item
-            self.layout.addWidget(self.data)
         else:
             self.data = None
 
@@ -86,45 +95,104 @@ class Setting:
             else:
                 self.check.setChecked(True)
 
-    @property
-    def value(self):
+        # Pick the value accessors once instead of on every access
         if self.config == self.CHECK:
-            return self.check.isChecked()
-        elif self.config & self.CHECK:
-            if not self.check.isChecked():
-                return None
+            self._get_value = self.check.isChecked
+            self._set_value = self._set_checked
+        else:
+            if self.config & self.LINE:
+                self._get_raw = self.data.text
+                self._set_raw = self.data.setText
+            else:
+                self._get_raw = self.data.currentText
+                self._set_raw = self._set_combo_text
+            if self.config & self.CHECK:
+                self._get_value = self._get_optional
+                self._set_value = self._set_optional
+            else:
+                self._get_value = self._get_converted
+                self._set_value = self._set_converted
+
+        if self.check is not None:
+            self.check.toggled.connect(self._on_edit)
         if self.config & self.LINE:
-            raw = self.data.text()
+            self.data.textChanged.connect(self._on_edit)
         elif self.config & self.COMBO:
-            raw = self.data.currentText()
+            self.data.currentIndexChanged.connect(self._on_edit)
+        self._cached_value = self._get_value()
+
+    @pyqtSlot()
+    def _on_edit(self):
+        """
+        Update the cached value and report the edit.
+        """
+        self._cached_value = self._get_value()
+        self.edited.emit()
+
+    def attach_to_grid(self, grid, row, col=0):
+        """
+        Place this setting's widgets into a row of a QGridLayout.
+
+        Parameters
+        ----------
+        grid: QGridLayout
+            Layout to add the widgets to
+
+        row: int
+            Row of the grid to fill
+
+        col: int, optional
+            First of the two grid columns to use
+        """
+        if self.check is None:
+            grid.addWidget(self.data, row, col, 1, 2)
+        elif self.data is None:
+            grid.addWidget(self.check, row, col, 1, 2)
         else:
-            raw = None
-        try:
-            return self.data_type(raw)
-        except Exception:
-            return raw
+            grid.addWidget(self.check, row, col)
+            grid.addWidget(self.data, row, col + 1)
+
+    @property
+    def value(self):
+        return self._cached_value
 
     @value.setter
     def value(self, val):
-        if self.config == self.CHECK:
-            self.check.setChecked(bool(val))
+        self._set_value(val)
+
+    def _get_converted(self):
+        # Keep the last good value while the text does not parse, e.g. when
+        # the user is halfway through typing a number. Types without an entry
+        # in _PARSERS, like NoneType, raise TypeError instead
+        try:
+            return self._parse(self._get_raw())
+        except (TypeError, ValueError):
+            return self._cached_value
+
+    def _get_optional(self):
+        if not self.check.isChecked():
+            return None
+        return self._get_converted()
+
+    def _set_checked(self, val):
+        self.check.setChecked(bool(val))
+
+    def _set_converted(self, val):
+        try:
+            val = self.data_type(val)
+        except Exception:
+            logger.exception('Invalid data type')
             return
-        elif self.config & self.CHECK and val is None:
+        self._set_raw(str(val))
+
+    def _set_optional(self, val):
+        if val is None:
             self.check.setChecked(False)
-            return
         else:
-            try:
-                val = self.data_type(val)
-            except Exception:
-                logger.exception('Invalid data type')
-                return
-            finally:
-                txt = str(val)
-            if self.config & self.LINE:
-                self.data.setText(txt)
-            elif self.config & self.COMBO:
-                index = self.enum.index(txt)
-                self.data.setCurrentIndex(index)
+            self._set_converted(val)
+
+    def _set_combo_text(self, txt):
+        self.data.setCurrentIndex(self.data.findText(txt))
 
 
 class SettingsGroup:
@@ -140,33 +208,39 @@ class SettingsGroup:
             Mapping of header to list of Setting objects
         """
         self.settings = {}
+        self._values_cache = None
         self.window = QDialog(parent=parent)
         self.window.setWindowTitle('Skywalker Settings')
+        # Build the full layout before handing it to the window so Qt does
+        # not re-layout the dialog for every row we add
+        self.window.setUpdatesEnabled(False)
         main_layout = QVBoxLayout()
-        self.window.setLayout(main_layout)
         self.window.setSizePolicy(QSizePolicy.Minimum,
                                   QSizePolicy.Minimum)
         all_cols_layout = QHBoxLayout()
         main_layout.addLayout(all_cols_layout)
         if collumns is None:
             collumns = [list(settings.keys())]
+        titles = {header: header.capitalize() for header in settings}
+        names = {setting.name: setting.name.capitalize()
+                 for group in settings.values() for setting in group}
         for col in collumns:
             col_layout = QVBoxLayout()
             all_cols_layout.addLayout(col_layout)
             for header in col:
-                title = QLabel()
-                title.setText(header.capitalize())
+                title = QLabel(titles[header])
                 title.setAlignment(Qt.AlignCenter)
                 col_layout.addWidget(title)
-                form = QFormLayout()
-                col_layout.addLayout(form)
-                for setting in settings[header]:
+                grid = QGridLayout()
+                col_layout.addLayout(grid)
+                for row, setting in enumerate(settings[header]):
                     self.settings[setting.name] = setting
-                    label = QLabel()
-                    label.setText(setting.name.capitalize())
+                    setting.edited.connect(self._invalidate)
+                    label = QLabel(names[setting.name])
                     label.setSizePolicy(QSizePolicy.Minimum,
                                         QSizePolicy.Minimum)
-                    form.addRow(label, setting.layout)
+                    grid.addWidget(label, row, 0)
+                    setting.attach_to_grid(grid, row, col=1)
             vertical_spacer = QSpacerItem(20, 10,
                                           QSizePolicy.Minimum,
                                           QSizePolicy.Expanding)
@@ -183,10 +257,18 @@ class SettingsGroup:
         confirm_layout.addItem(horizontal_spacer)
         confirm_layout.addWidget(cancel_button)
         confirm_layout.addWidget(apply_button)
+        self.window.setLayout(main_layout)
+        self.window.setUpdatesEnabled(True)
 
     @property
     def values(self):
-        return {n: s.value for n, s in self.settings.items()}
+        """
+        Copy of the current value of every setting, keyed by name.
+        """
+        if self._values_cache is None:
+            self._values_cache = {n: s.value for n, s in self.settings.items()}
+        # Hand out a copy so callers cannot edit our cache
+        return dict(self._values_cache)
 
     @values.setter
     def values(self, set_dict):
@@ -194,6 +276,12 @@ class SettingsGroup:
             if k in self.settings:
                 self.settings[k].value = v
 
+    def _invalidate(self):
+        """
+        Drop the cached values after any setting changes.
+        """
+        self._values_cache = None
+
     def dialog_at(self, *args, **kwargs):
         self.window.move(*args, **kwargs)
         self.window.show()
@@ -1,9 +1,18 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import logging
+from operator import attrgetter
+
 from pydm.PyQt.QtCore import QCoreApplication
 
 logger = logging.getLogger(__name__)
+_get_sizes = attrgetter('detector.cam.array_size')
+_get_centroid = attrgetter('detector.stats2.centroid')
+# rotation: (centroid key, use mod_x, use mod_y, swap x and y)
+_ROT_LAYOUT = {0: ('detector_stats2_centroid_x', False, False, False),
+               90: ('detector_stats2_centroid_y', True, False, True),
+               180: ('detector_stats2_centroid_x', True, True, False),
+               270: ('detector_stats2_centroid_y', False, True, True)}
 
 
 def ad_stats_x_axis_rot(imager, rotation):
@@ -23,39 +32,31 @@ def ad_stats_x_axis_rot(imager, rotation):
         ['x_size']: Signal associated with the x size
         ['y_size']: Signal associated with the y size
     """
-    det_key_base = 'detector_stats2_centroid_'
-    sizes = imager.detector.cam.array_size
-    centroid = imager.detector.stats2.centroid
-    rotation = rotation % 360
-    if rotation % 180 == 0:
-        det_key = det_key_base + 'x'
-        x_size = sizes.array_size_x
-        y_size = sizes.array_size_y
-        x_cent = centroid.x
-        y_cent = centroid.y
-    else:
-        det_key = det_key_base + 'y'
+    sizes = _get_sizes(imager)
+    centroid = _get_centroid(imager)
+    # Anything other than 0, 90 or 180 lays out like 270
+    det_key, use_mod_x, use_mod_y, swap_xy = _ROT_LAYOUT.get(rotation % 360,
+                                                             _ROT_LAYOUT[270])
+    if swap_xy:
         x_size = sizes.array_size_y
         y_size = sizes.array_size_x
         x_cent = centroid.y
         y_cent = centroid.x
-    if rotation == 0:
-        mod_x = None
-        mod_y = None
-    elif rotation == 90:
-        mod_x = x_size.value
-        mod_y = None
-    elif rotation == 180:
-        mod_x = x_size.value
-        mod_y = y_size.value
     else:
-        mod_x = None
-        mod_y = y_size.value
+        x_size = sizes.array_size_x
+        y_size = sizes.array_size_y
+        x_cent = centroid.x
+        y_cent = centroid.y
+    mod_x = x_size.value if use_mod_x else None
+    mod_y = y_size.value if use_mod_y else None
     return dict(key=det_key, mod_x=mod_x, mod_y=mod_y, x_cent=x_cent,
                 y_cent=y_cent, x_size=x_size, y_size=y_size)
 
 
 def debug_log_pydm_connections():
+    # Counting walks every connection, skip it when nobody will see it
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     QApp = QCoreApplication.instance()
     plugins = QApp.plugins
     ca_plugin = plugins['ca']
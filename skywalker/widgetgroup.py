@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-from pydm.PyQt.QtCore import QCoreApplication
+from operator import attrgetter
+
+from pydm.PyQt.QtCore import Qt, QCoreApplication, QMetaObject, QTimer
 from pydm.PyQt.QtGui import QDoubleValidator
 
 from .utils import ad_stats_x_axis_rot
@@ -10,6 +12,8 @@ class BaseWidgetGroup:
     """
     A group of widgets that are part of a set with a single label.
     """
+    __slots__ = ('widgets', 'label', '_all_widgets', '__weakref__')
+
     def __init__(self, widgets, label=None, name=None, **kwargs):
         """
         Parameters
@@ -25,32 +29,33 @@ class BaseWidgetGroup:
         """
         self.widgets = widgets
         self.label = label
+        # Everything hide and show touch, label included
+        if label is None:
+            self._all_widgets = tuple(widgets)
+        else:
+            self._all_widgets = tuple(widgets) + (label,)
         self.setup(name=name, **kwargs)
 
     def setup(self, name=None, **kwargs):
         """
         Do basic widget setup. For Base, this is just changing the label text.
         """
-        if None not in (self.label, name):
+        if None not in (self.label, name) and self.label.text() != name:
             self.label.setText(name)
 
     def hide(self):
         """
         Hide all widgets in group.
         """
-        for widget in self.widgets:
-            widget.hide()
-        if self.label is not None:
-            self.label.hide()
+        for widget in self._all_widgets:
+            widget.setVisible(False)
 
     def show(self):
         """
         Show all widgets in group.
         """
-        for widget in self.widgets:
-            widget.show()
-        if self.label is not None:
-            self.label.show()
+        for widget in self._all_widgets:
+            widget.setVisible(True)
 
     def text(self):
         if self.label is None:
@@ -62,7 +67,13 @@ class BaseWidgetGroup:
 class ValueWidgetGroup(BaseWidgetGroup):
     """
     A group of widgets that have a user-editable value field.
+
+    The parsed value is kept up to date from the line edit's textChanged
+    signal, so reading it does not touch the widget.
     """
+    __slots__ = ('line_edit', 'checkbox', 'cache', 'force_type',
+                 '_cached_value')
+
     def __init__(self, line_edit, label, checkbox=None, name=None, cache=None,
                  validator=None):
         """
@@ -97,14 +108,17 @@ class ValueWidgetGroup(BaseWidgetGroup):
             else:
                 raise NotImplementedError
             self.line_edit.setValidator(validator)
+        self.update_value()
+        self.line_edit.textChanged.connect(self.update_value)
         super().__init__(widgets, label=label, name=name)
 
     def setup(self, name=None, **kwargs):
         """
         Put name in the checkbox too
         """
-        super().setup(name=name, **kwargs)
-        if None not in (self.checkbox, name):
+        if None not in (self.label, name) and self.label.text() != name:
+            self.label.setText(name)
+        if None not in (self.checkbox, name) and self.checkbox.text() != name:
             self.checkbox.setText(name)
         if self.checkbox is not None:
             self.checkbox.setChecked(False)
@@ -132,24 +146,38 @@ class ValueWidgetGroup(BaseWidgetGroup):
         Reset the value
         """
         self.line_edit.clear()
+        self.update_value()
 
-    @property
-    def value(self):
+    def update_value(self, *args):
+        """
+        Parse the line edit text into the cached value. Also called directly
+        after our own writes in case the line edit's signals are blocked.
+        """
         raw = self.line_edit.text()
         if not raw:
-            return None
-        if self.force_type is None:
-            return raw
+            value = None
+        elif self.force_type is None:
+            value = raw
         else:
+            # The validator still lets through partial input like '-' or '.'
             try:
-                return self.force_type(raw)
-            except Exception:
-                return None
+                value = self.force_type(raw)
+            except ValueError:
+                value = None
+        self._cached_value = value
+
+    @property
+    def value(self):
+        return self._cached_value
 
     @value.setter
     def value(self, val):
-        txt = str(val)
-        self.line_edit.setText(txt)
+        if val is None:
+            self.clear()
+            return
+        # str keeps every digit, so saved goals load back unchanged
+        self.line_edit.setText(str(val))
+        self.update_value()
 
     @property
     def is_checked(self):
@@ -159,12 +187,23 @@ class ValueWidgetGroup(BaseWidgetGroup):
             return self.checkbox.isChecked()
 
 
+def _assign_channel(widget, chan):
+    widget.channel = chan
+
+
 class PydmWidgetGroup(BaseWidgetGroup):
     """
     A group of pydm widgets under a single label that may be set up and reset
     as a group.
     """
+    __slots__ = ('_preserve', 'pvnames')
+
     protocol = 'ca://'
+    plugin_name = 'ca'
+    # Widget class -> function(widget, channel), shared by all groups
+    _channel_setters = {}
+    # pv name -> channel address, shared by all groups
+    _channels = {}
 
     def __init__(self, widgets, pvnames, label=None, name=None, preserve=None,
                  **kwargs):
@@ -178,6 +217,7 @@ class PydmWidgetGroup(BaseWidgetGroup):
             self._preserve = []
         else:
             self._preserve = preserve
+        self.pvnames = pvnames
         super().__init__(widgets, label=label, name=name,
                          pvnames=pvnames, **kwargs)
 
@@ -185,25 +225,51 @@ class PydmWidgetGroup(BaseWidgetGroup):
         """
         In addition to base setup, assign pv names.
         """
-        super().setup(name=name, **kwargs)
+        if None not in (self.label, name) and self.label.text() != name:
+            self.label.setText(name)
         if pvnames is None:
             pvnames = [None] * len(self.widgets)
         for widget, pvname in zip(self.widgets, pvnames):
-            if pvname is None:
-                chan = ''
-            else:
-                chan = self.protocol + pvname
-            try:
-                widget.setChannel(chan)
-            except Exception:
-                widget.channel = chan
+            self.set_channel(widget, self.to_channel(pvname))
+
+    def to_channel(self, pvname):
+        """
+        Pydm channel address for a pv name, or '' for no pv.
+        """
+        if not pvname:
+            return ''
+        try:
+            return self._channels[pvname]
+        except KeyError:
+            chan = self._channels[pvname] = self.protocol + pvname
+            return chan
+
+    def set_channel(self, widget, chan):
+        """
+        Point a widget at a pydm channel, using setChannel if the widget class
+        has it and the channel property otherwise.
+        """
+        cls = type(widget)
+        try:
+            setter = self._channel_setters[cls]
+        except KeyError:
+            setter = getattr(cls, 'setChannel', None)
+            if setter is None:
+                setter = _assign_channel
+            self._channel_setters[cls] = setter
+        setter(widget, chan)
 
     def change_pvs(self, pvnames, name=None, **kwargs):
         """
-        Swap active pv names and manage connections
+        Swap active pv names and manage connections. If the pv names are the
+        same as before, the existing connections are kept as they are.
         """
+        if pvnames == self.pvnames:
+            self.setup(pvnames=pvnames, name=name, **kwargs)
+            return
         self.preserve_connections()
         self.clear_connections()
+        self.pvnames = pvnames
         self.setup(pvnames=pvnames, name=name, **kwargs)
         self.create_connections()
 
@@ -228,9 +294,10 @@ class PydmWidgetGroup(BaseWidgetGroup):
         """
         Trick pydm into keeping connections around.
         """
+        if not self._preserve:
+            return
         QApp = QCoreApplication.instance()
-        protocol = self.protocol.split('://')[0]
-        plugin = QApp.plugins[protocol]
+        plugin = QApp.plugins[self.plugin_name]
         for widget in self._preserve:
             if hasattr(widget, 'channels'):
                 for channel in widget.channels():
@@ -247,6 +314,8 @@ class ObjWidgetGroup(PydmWidgetGroup):
     stripped out and replaced to change context, provided the class is the
     same.
     """
+    __slots__ = ('attrs', 'obj', '_attr_getters', '_pvnames_cache')
+
     def __init__(self, widgets, attrs, obj, label=None, preserve=None,
                  **kwargs):
         """
@@ -260,6 +329,8 @@ class ObjWidgetGroup(PydmWidgetGroup):
             fields that we can use to send pvname info to pydm
         """
         self.attrs = attrs
+        self._attr_getters = [attrgetter(attr) for attr in attrs]
+        self._pvnames_cache = {}
         self.obj = obj
         if obj is None:
             name = None
@@ -280,6 +351,9 @@ class ObjWidgetGroup(PydmWidgetGroup):
         obj: object
             The new object
         """
+        # Same object and no new settings means nothing to reconnect
+        if obj is self.obj and not kwargs:
+            return
         self.obj = obj
         pvnames = self.get_pvnames(obj)
         if obj is None:
@@ -290,37 +364,48 @@ class ObjWidgetGroup(PydmWidgetGroup):
 
     def get_pvnames(self, obj):
         """
-        Given an object, return the pvnames based on self.attrs
+        Given an object, return the pvnames based on self.attrs. The result
+        is remembered per object, do not modify it.
         """
         if obj is None:
             return None
-        pvnames = []
-        for attr in self.attrs:
-            sig = self.nested_getattr(obj, attr)
-            try:
-                pvnames.append(sig.pvname)
-            except AttributeError:
-                pvnames.append(None)
+        try:
+            return self._pvnames_cache[obj]
+        except KeyError:
+            pass
+        pvnames = [getattr(getter(obj), 'pvname', None)
+                   for getter in self._attr_getters]
+        self._pvnames_cache[obj] = pvnames
         return pvnames
 
-    def nested_getattr(self, obj, attr):
-        """
-        Do a getattr more than one level deep, splitting on '.'
-        """
-        steps = attr.split('.')
-        for step in steps:
-            obj = getattr(obj, step)
-        return obj
-
 
 class ImgObjWidget(ObjWidgetGroup):
     """
     Macros to set up the image widget channels from opyhd areadetector obj.
     This also includes all of the centroid stuff.
+
+    Centroid monitor callbacks only schedule a refresh, and the centroid
+    widgets are updated at most once every "refresh_ms" milliseconds.
     """
+    __slots__ = ('refresh_timer', 'refresh_pending', 'centroid_cb',
+                 'cent_x_widget', 'cent_y_widget', 'delta_x_widget',
+                 'delta_y_widget', 'state_widget', 'state_select_widget',
+                 'goals_source', 'xpos', 'ypos', 'rotation', 'size_x',
+                 'size_y', 'cent_x', 'cent_y', 'mod_x', 'mod_y', 'raw_x',
+                 'raw_y', '_last_delta_state')
+    refresh_ms = 33
+    _fmt1 = '{:.1f}'.format
+
     def __init__(self, img_widget, img_obj, cent_x_widget, cent_y_widget,
                  delta_x_widget, delta_y_widget, state_widget,
                  state_select_widget, label, goals_source, rotation=0):
+        self.refresh_timer = QTimer(img_widget)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(self.refresh_ms)
+        self.refresh_timer.timeout.connect(self.refresh_centroid)
+        self.refresh_pending = False
+        # One bound method for every subscribe and clear_sub call
+        self.centroid_cb = self.update_centroid
         self.cent_x_widget = cent_x_widget
         self.cent_y_widget = cent_y_widget
         self.delta_x_widget = delta_x_widget
@@ -328,8 +413,6 @@ class ImgObjWidget(ObjWidgetGroup):
         self.state_widget = state_widget
         self.state_select_widget = state_select_widget
         self.goals_source = goals_source
-        self.xpos = 0
-        self.ypos = 0
         attrs = ['detector.image2.width',
                  'detector.image2.array_data']
         super().__init__([img_widget, state_widget, state_select_widget],
@@ -338,10 +421,11 @@ class ImgObjWidget(ObjWidgetGroup):
                          preserve=[state_widget, state_select_widget])
 
     def setup(self, *, pvnames, name=None, rotation=0, **kwargs):
-        BaseWidgetGroup.setup(self, name=name)
+        if None not in (self.label, name) and self.label.text() != name:
+            self.label.setText(name)
         try:
-            self.cent_x.clear_sub(self.update_centroid)
-            self.cent_y.clear_sub(self.update_centroid)
+            self.cent_x.clear_sub(self.centroid_cb)
+            self.cent_y.clear_sub(self.centroid_cb)
         except (AttributeError, ValueError):
             pass
         self.rotation = rotation
@@ -368,56 +452,86 @@ class ImgObjWidget(ObjWidgetGroup):
                           yRange=(0, self.size_y),
                           padding=0.0)
 
-        if width_pv is None:
-            width_channel = ''
-        else:
-            width_channel = self.protocol + width_pv
-        if image_pv is None:
-            image_channel = ''
-        else:
-            image_channel = self.protocol + image_pv
-        img_widget.widthChannel = width_channel
-        img_widget.imageChannel = image_channel
+        img_widget.widthChannel = self.to_channel(width_pv)
+        img_widget.imageChannel = self.to_channel(image_pv)
+        self.raw_x = None
+        self.raw_y = None
+        self.xpos = None
+        self.ypos = None
+        # Make the next update_deltas redraw
+        self._last_delta_state = None
         if self.obj is not None:
-            self.cent_x.subscribe(self.update_centroid)
-            self.cent_y.subscribe(self.update_centroid)
+            self.cent_x.subscribe(self.centroid_cb)
+            self.cent_y.subscribe(self.centroid_cb)
 
         try:
-            state_read = self.obj.states.state._read_pv.pvname or ''
-            state_write = self.obj.states.state._write_pv.pvname or ''
+            state_read = self.obj.states.state._read_pv.pvname
+            state_write = self.obj.states.state._write_pv.pvname
         except AttributeError:
-            state_read = ''
-            state_write = ''
-        if state_read:
-            state_read = self.protocol + state_read
-        if state_write:
-            state_write = self.protocol + state_write
-
-        self.state_widget.channel = state_read
-        self.state_select_widget.channel = state_write
-
-    def update_centroid(self, *args, **kwargs):
-        xpos = self.cent_x.value
-        ypos = self.cent_y.value
+            state_read = None
+            state_write = None
+
+        self.set_channel(self.state_widget, self.to_channel(state_read))
+        self.set_channel(self.state_select_widget,
+                         self.to_channel(state_write))
+
+    def update_centroid(self, *args, value=None, obj=None, **kwargs):
+        """
+        Centroid subscription callback. Keeps the value delivered by the
+        callback and starts the refresh timer on the gui thread unless a
+        refresh is already on the way.
+        """
+        if obj is self.cent_x:
+            self.raw_x = value
+        elif obj is self.cent_y:
+            self.raw_y = value
+        else:
+            return
+        if not self.refresh_pending:
+            self.refresh_pending = True
+            QMetaObject.invokeMethod(self.refresh_timer, 'start',
+                                     Qt.QueuedConnection)
+
+    def refresh_centroid(self):
+        """
+        Show the latest centroid and goal deltas.
+        """
+        self.refresh_pending = False
+        xpos = self.raw_x
+        ypos = self.raw_y
         if self.mod_x is not None and xpos not in (0, None):
             xpos = self.mod_x - xpos
         if self.mod_y is not None and ypos not in (0, None):
             ypos = self.mod_y - ypos
+        if xpos is None:
+            xpos = self.xpos
+        if ypos is None:
+            ypos = self.ypos
+        if xpos == self.xpos and ypos == self.ypos:
+            return
         if xpos is not None:
-            self.cent_x_widget.setText("{:.1f}".format(xpos))
+            self.cent_x_widget.setText(self._fmt1(xpos))
             self.xpos = xpos
         if ypos is not None:
-            self.cent_y_widget.setText("{:.1f}".format(ypos))
+            self.cent_y_widget.setText(self._fmt1(ypos))
             self.ypos = ypos
         self.update_deltas()
 
     def update_deltas(self, *args, **kwargs):
         goal = self.goals_source.goal()
-        if goal is None:
-            self.delta_x_widget.clear()
+        state = (self.xpos, goal)
+        if state == self._last_delta_state:
+            return
+        self._last_delta_state = state
+        if goal is None or self.xpos is None:
+            delta_x = ''
         else:
-            self.delta_x_widget.setText("{:.1f}".format(self.xpos - goal))
-        self.delta_y_widget.clear()
+            delta_x = self._fmt1(self.xpos - goal)
+        # Skip the repaint when the text would not change
+        if self.delta_x_widget.text() != delta_x:
+            self.delta_x_widget.setText(delta_x)
+        if self.delta_y_widget.text():
+            self.delta_y_widget.clear()
 
     @property
     def size(self):
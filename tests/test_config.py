@@ -2,6 +2,7 @@
 # Standard #
 ############
 import os.path
+import threading
 
 ###############
 # Third Party #
@@ -14,7 +15,7 @@ import pytest
 ##########
 import pcdsdevices
 from pcdsdevices.sim.pim import PIM
-from skywalker.config import ConfigReader, sim_config
+from skywalker.config import ConfigReader
 from pcdsdevices.sim.pv import using_fake_epics_pv
 
 #Hack to use simulated PIM
@@ -46,3 +47,26 @@ def test_lightpath_loading():
     devs, containers = cfg.load_configuration()
     assert len(devs) == 3
     assert len(containers) == 0
+
+@using_fake_epics_pv
+def test_lightpath_devices_built_on_calling_thread(monkeypatch):
+    cfg = ConfigReader(make_test_path('happi.json'),
+                       make_test_path('system.json'))
+    #Record the thread each device is created on
+    threads = []
+    build = cfg._build_device
+    def record_build(name):
+        threads.append(threading.current_thread())
+        return build(name)
+    monkeypatch.setattr(cfg, '_build_device', record_build)
+    devs, containers = cfg.load_configuration()
+    assert len(devs) == 3
+    assert threads
+    assert all(t is threading.current_thread() for t in threads)
+
+def test_happi_lookup_cached():
+    cfg = ConfigReader(make_test_path('happi.json'),
+                       make_test_path('system.json'))
+    #Check that a second lookup returns the cached container
+    container = cfg._load_happi_obj('FEE M1H')
+    assert cfg._load_happi_obj('FEE M1H') is container
@@ -0,0 +1,41 @@
+############
+# Standard #
+############
+
+###############
+# Third Party #
+###############
+import pytest
+from pydm.PyQt.QtGui import QApplication, QLineEdit, QLabel, QDoubleValidator
+
+##########
+# Module #
+##########
+from skywalker.widgetgroup import ValueWidgetGroup
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QApplication.instance() or QApplication([])
+
+def test_goal_value_keeps_precision(app):
+    goal = ValueWidgetGroup(QLineEdit(), QLabel(), name='goal',
+                            validator=QDoubleValidator(0, 5000, 3))
+    #Seven significant digits, the most a goal can have
+    goal.value = 4999.125
+    assert goal.line_edit.text() == '4999.125'
+    assert goal.value == 4999.125
+    #Survives a save and load through the cache
+    goal.save_value()
+    goal.clear()
+    assert goal.value is None
+    goal.load_value('goal')
+    assert goal.value == 4999.125
+
+def test_goal_value_none_clears(app):
+    goal = ValueWidgetGroup(QLineEdit(), QLabel(), name='goal',
+                            validator=QDoubleValidator(0, 5000, 3))
+    goal.value = 12.5
+    goal.value = None
+    assert goal.line_edit.text() == ''
+    assert goal.value is None